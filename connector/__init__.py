@@ -1 +1 @@
-from .core import Connector, AutoConnector
\ No newline at end of file
+from .core import Connector, AutoConnector, AsyncConnector
\ No newline at end of file
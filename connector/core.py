@@ -1,9 +1,39 @@
+import functools
+import io
+import time
+
 import pandas as pd
+from sqlalchemy import event, text
 from sqlalchemy.exc import SQLAlchemyError
-from .db import create_connection
+from .db import create_async_connection, create_connection, create_connection_string
 from .utils import load_dotenv_file, load_env_var
 
 
+def _psql_copy_insert(table, conn, keys, data_iter):
+    """to_sql 'method' callable that loads rows through PostgreSQL's COPY FROM STDIN."""
+    import csv
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerows(data_iter)
+    buffer.seek(0)
+
+    columns = ', '.join(f'"{key}"' for key in keys)
+    target = f'{table.schema}.{table.name}' if table.schema else table.name
+    with conn.connection.cursor() as cursor:
+        cursor.copy_expert(f"COPY {target} ({columns}) FROM STDIN WITH CSV", buffer)
+
+
+@functools.lru_cache(maxsize=512)
+def _text_clause(query: str):
+    """Return a TextClause for the query, reusing the same object for repeated strings.
+
+    SQLAlchemy caches compiled statements per clause object, so handing back the
+    identical TextClause lets repeated queries skip re-parsing and re-compiling.
+    """
+    return text(query)
+
+
 class Connector:
     """
     A database connector class for managing connections and executing SQL queries.
@@ -18,7 +48,7 @@ class Connector:
         execute_query(query, params=None): Execute a given SQL query with optional parameters.
     """
 
-    def __init__(self, db_type, db_server, db_database, db_username, db_password, driver=None):
+    def __init__(self, db_type, db_server, db_database, db_username, db_password, driver=None, **engine_kwargs):
         """
         Initializes the Connector with a database connection.
 
@@ -29,37 +59,308 @@ class Connector:
             db_username (str): The username for database authentication.
             db_password (str): The password for database authentication.
             driver (str, optional): The ODBC driver to use for MSSQL connections. Required for MSSQL.
+            **engine_kwargs: Optional pool tuning arguments (e.g. pool_size, max_overflow,
+                pool_recycle) forwarded to the engine creation.
 
         The database connection is established based on the specified parameters,
         including the use of an appropriate driver for MSSQL connections.
         """
-        self.engine = create_connection(db_type, db_server, db_database, db_username, db_password, driver)
+        self.engine = create_connection(db_type, db_server, db_database, db_username, db_password, driver, **engine_kwargs)
+        # Kept for readers that bypass SQLAlchemy, e.g. the connectorx Arrow path.
+        url = create_connection_string(db_type, db_server, db_database, db_username, db_password, driver)
+        self._connection_string = url.render_as_string(hide_password=False)
+
+
+    def execute_query(self, query, params=None, chunksize=None, stream_results=False, arrow=False):
+        """
+        Execute a SQL query and return the results as a pandas DataFrame or an iterator of DataFrames.
+
+        By default the full result set is returned as a single DataFrame. Pass
+        'chunksize' to instead get an iterator over DataFrames of up to 'chunksize'
+        rows each, and 'stream_results=True' to fetch rows through a server-side
+        cursor as the iterator is consumed. With both set, peak memory is bounded
+        by the chunk size regardless of the result set size, which is the right
+        mode for multi-GB results. The connection is closed automatically when the
+        iterator is exhausted or abandoned.
+
+        Parameters:
+            query (str): The SQL query to execute, using named placeholders like ':name'.
+            params (dict, optional): A dictionary mapping placeholder names to values,
+                e.g. {'name': 8} for a query containing ':name'. Defaults to None.
+            chunksize (int, optional): The maximum number of rows per DataFrame chunk.
+                If None, a single DataFrame is returned. Defaults to None.
+            stream_results (bool, optional): If True, use a server-side cursor so rows
+                are fetched lazily instead of materialized by the driver. Defaults to False.
+            arrow (bool, optional): If True, back the returned DataFrames with Arrow
+                arrays ('dtype_backend="pyarrow"') instead of NumPy. Arrow string
+                columns are stored contiguously rather than as boxed Python objects,
+                typically several times smaller for text-heavy results. Defaults to False.
+
+        Returns:
+            DataFrame or Iterator of DataFrames: The query results, chunked if 'chunksize' is given.
+
+        Raises:
+            SQLAlchemyError: If there's an issue executing the query.
+        """
+        connection = self.engine.connect()
+        if stream_results:
+            connection = connection.execution_options(stream_results=True,
+                                                      max_row_buffer=chunksize or 10_000)
+        read_kwargs = {'dtype_backend': 'pyarrow'} if arrow else {}
+        try:
+            result = pd.read_sql_query(sql=_text_clause(query), con=connection, params=params,
+                                       chunksize=chunksize, **read_kwargs)
+        except (SQLAlchemyError, pd.errors.DatabaseError) as e:
+            # pandas wraps execution failures in its own DatabaseError, so catch
+            # both to keep the documented SQLAlchemyError contract.
+            connection.close()
+            raise SQLAlchemyError(f"An error occurred while executing the query: {e}")
+        except BaseException:
+            connection.close()
+            raise
+
+        if chunksize is None:
+            connection.close()
+            return result
+
+        def _stream():
+            try:
+                yield from result
+            except (SQLAlchemyError, pd.errors.DatabaseError) as e:
+                raise SQLAlchemyError(f"An error occurred while executing the query: {e}")
+            finally:
+                # Release the server-side cursor and return the connection to the pool.
+                connection.close()
+
+        return _stream()
+
+    # Upper bound on cached query results per Connector; the oldest entry is
+    # evicted once the cache is full.
+    _QUERY_CACHE_MAXSIZE = 128
+
+    def execute_query_cached(self, query, params=None, ttl=60):
+        """
+        Execute a SQL query, memoizing the resulting DataFrame for 'ttl' seconds.
 
+        Intended for idempotent SELECTs against slowly-changing reference data
+        (lookup tables, configuration) that services would otherwise re-fetch on
+        every call. Results are cached per Connector, keyed by the query and its
+        parameters; a repeat call within 'ttl' seconds returns the cached frame
+        without a database round-trip. The returned DataFrame is a shallow copy,
+        so callers cannot corrupt the cached result by adding or dropping columns,
+        but should still treat it as read-only.
 
-    def execute_query(self, query, params=None):
+        Parameters:
+            query (str): The SQL query to execute, using named placeholders like ':name'.
+            params (dict, optional): A dictionary mapping placeholder names to values. Defaults to None.
+            ttl (int, optional): How many seconds a cached result stays valid. Defaults to 60.
+
+        Returns:
+            DataFrame: A pandas DataFrame containing the query results.
+
+        Raises:
+            SQLAlchemyError: If there's an issue executing the query.
         """
-        Execute a SQL query and return the results as an iterator of pandas DataFrames, each with a specified chunksize.
+        cache = getattr(self, '_query_cache', None)
+        if cache is None:
+            cache = self._query_cache = {}
 
-        This method executes a given SQL query optionally using parameters and returns an iterator over DataFrames,
-        with each DataFrame containing up to 'chunksize' rows of data. This is particularly useful for processing
-        large datasets that do not fit into memory all at once.
+        key = (query, tuple(sorted(params.items())) if params else None)
+        cached = cache.get(key)
+        if cached is not None:
+            fetched_at, df = cached
+            # Freshness is judged against the current call's ttl, so a caller
+            # demanding fresher data than an earlier one re-fetches.
+            if time.monotonic() - fetched_at < ttl:
+                return df.copy(deep=False)
+            del cache[key]
+
+        df = self.execute_query(query, params=params)
+        if len(cache) >= self._QUERY_CACHE_MAXSIZE:
+            cache.pop(next(iter(cache)))
+        cache[key] = (time.monotonic(), df)
+        return df.copy(deep=False)
+
+    def execute_raw(self, query, params=None, chunksize=10_000):
+        """
+        Execute a SQL query and yield the results as lists of SQLAlchemy Row objects.
+
+        Unlike execute_query, no DataFrame is built — there is no column type
+        inference, NumPy buffer allocation or index creation. Rows are fetched
+        through a server-side cursor in partitions of up to 'chunksize' rows, so
+        peak memory stays bounded by one partition. This is the right method for
+        row-at-a-time ETL and other consumers that do not need pandas; DataFrame
+        construction becomes a caller-side choice.
+
+        Parameters:
+            query (str): The SQL query to execute, using named placeholders like ':name'.
+            params (dict, optional): A dictionary mapping placeholder names to values. Defaults to None.
+            chunksize (int, optional): The maximum number of rows per partition. Defaults to 10,000.
+
+        Yields:
+            list of Row: Partitions of up to 'chunksize' rows of the query results.
+
+        Raises:
+            SQLAlchemyError: If there's an issue executing the query.
+        """
+        try:
+            with self.engine.connect() as connection:
+                connection = connection.execution_options(stream_results=True, yield_per=chunksize)
+                result = connection.execute(_text_clause(query), params)
+                yield from result.partitions(chunksize)
+        except SQLAlchemyError as e:
+            raise SQLAlchemyError(f"An error occurred while executing the query: {e}")
+
+    def execute_query_arrow(self, query, params=None):
+        """
+        Execute a SQL query and return the results as an Arrow-backed pandas DataFrame.
+
+        When the optional 'connectorx' package is installed and the dialect is one it
+        supports (PostgreSQL or MSSQL), the query bypasses the DB-API row-by-row fetch
+        path entirely: rows are decoded straight into Arrow buffers by a native reader,
+        which is several times faster and avoids boxing every value as a Python object.
+        Otherwise the query falls back to the regular SQLAlchemy path.
+
+        Either way the returned DataFrame uses 'pd.ArrowDtype' columns, which are more
+        compact than NumPy object columns and zero-copy for Arrow consumers.
+
+        Note that connectorx does not support bound parameters; when 'params' is given,
+        the SQLAlchemy fallback is used.
 
         Parameters:
             query (str): The SQL query to execute.
             params (dict, optional): A dictionary of parameters to pass with the query. Defaults to None.
 
         Returns:
-            Iterator of DataFrames: An iterator over DataFrames, each containing 'chunksize' rows of the query results.
+            DataFrame: A pandas DataFrame with Arrow-backed columns containing the query results.
 
         Raises:
             SQLAlchemyError: If there's an issue executing the query.
         """
+        if params is None and self.engine.dialect.name in ('postgresql', 'mssql'):
+            try:
+                import connectorx as cx
+            except ImportError:
+                pass
+            else:
+                # connectorx takes a plain URI without the SQLAlchemy driver suffix.
+                conn_str = self._connection_string.split('?')[0].replace('+pyodbc', '')
+                table = cx.read_sql(conn_str, query, return_type='arrow')
+                return table.to_pandas(types_mapper=pd.ArrowDtype)
+
         try:
-            # Use pandas read_sql_query to execute the query and return an iterator over DataFrames
-            return pd.read_sql_query(query, self.engine, params=params)
+            with self.engine.connect() as connection:
+                return pd.read_sql_query(sql=_text_clause(query), con=connection, params=params,
+                                         dtype_backend='pyarrow')
         except SQLAlchemyError as e:
             raise SQLAlchemyError(f"An error occurred while executing the query: {e}")
 
+    def write_dataframe(self, df, table, schema=None, if_exists='append', chunksize=10_000):
+        """
+        Write a pandas DataFrame to a database table using the fastest bulk-load path for the dialect.
+
+        Pandas' default 'to_sql' issues one INSERT statement per row, which is extremely
+        slow over a network. This method instead dispatches on the engine's dialect:
+
+        - postgresql: streams the DataFrame as CSV through 'COPY ... FROM STDIN', the
+          fastest ingestion path PostgreSQL offers.
+        - mssql: enables pyodbc's 'fast_executemany' so batches of rows are sent in a
+          single round-trip, then uses 'to_sql'.
+        - other dialects: falls back to 'to_sql' with multi-values INSERT statements.
+
+        Every path runs in a single transaction, so the whole load commits once
+        instead of once per chunk, and a failure rolls back cleanly.
+
+        Parameters:
+            df (DataFrame): The DataFrame to write.
+            table (str): The name of the target table.
+            schema (str, optional): The database schema of the target table. Defaults to None.
+            if_exists (str, optional): What to do if the table exists: 'fail', 'replace'
+                or 'append'. Defaults to 'append'.
+            chunksize (int, optional): The number of rows written per batch. Defaults to 10,000.
+
+        Raises:
+            SQLAlchemyError: If there's an issue writing the DataFrame.
+        """
+        try:
+            dialect = self.engine.dialect.name
+
+            if dialect == 'postgresql':
+                buffer = io.StringIO()
+                df.to_csv(buffer, index=False, header=False)
+                buffer.seek(0)
+                target = f'{schema}.{table}' if schema else table
+                # Name the columns so rows land by name rather than position
+                # when the existing table's column order differs from the frame's.
+                columns = ', '.join(f'"{key}"' for key in df.columns)
+                with self.engine.begin() as connection:
+                    # COPY expects the table to exist; let to_sql create it if
+                    # needed, on the same transaction as the COPY so a failure
+                    # rolls back the DDL too.
+                    df.head(0).to_sql(table, connection, schema=schema, if_exists=if_exists, index=False)
+                    with connection.connection.cursor() as cursor:
+                        cursor.copy_expert(f"COPY {target} ({columns}) FROM STDIN WITH CSV", buffer)
+            elif dialect == 'mssql':
+                self._enable_fast_executemany()
+                # One transaction around all chunks: a single BEGIN/COMMIT instead
+                # of an autocommit round-trip per chunk.
+                with self.engine.begin() as connection:
+                    df.to_sql(table, connection, schema=schema, if_exists=if_exists, index=False, chunksize=chunksize)
+            else:
+                with self.engine.begin() as connection:
+                    df.to_sql(table, connection, schema=schema, if_exists=if_exists, index=False,
+                              chunksize=chunksize, method='multi')
+        except SQLAlchemyError as e:
+            raise SQLAlchemyError(f"An error occurred while writing the DataFrame: {e}")
+
+    def insert_dataframe(self, df, table, schema=None, if_exists='append', method=None, chunksize=1000):
+        """
+        Insert a pandas DataFrame into a database table via 'to_sql' with batched INSERTs.
+
+        This is a thinner alternative to write_dataframe for callers who want to stay
+        on the 'to_sql' code path but control how rows are batched. By default the
+        insert method is picked per dialect: a COPY FROM STDIN callable for
+        PostgreSQL, and 'multi' (multi-values INSERT statements, packing 'chunksize'
+        rows into one statement and one round-trip) everywhere else.
+
+        Parameters:
+            df (DataFrame): The DataFrame to insert.
+            table (str): The name of the target table.
+            schema (str, optional): The database schema of the target table. Defaults to None.
+            if_exists (str, optional): What to do if the table exists: 'fail', 'replace'
+                or 'append'. Defaults to 'append'.
+            method (str or callable, optional): Insert method passed to 'to_sql'
+                ('multi' or a callable with signature (table, conn, keys, data_iter)).
+                Defaults to None, which picks a dialect-appropriate method.
+            chunksize (int, optional): The number of rows inserted per batch. Defaults to 1,000.
+
+        Raises:
+            SQLAlchemyError: If there's an issue inserting the DataFrame.
+        """
+        if method is None:
+            method = _psql_copy_insert if self.engine.dialect.name == 'postgresql' else 'multi'
+
+        try:
+            # One transaction around all chunks: a single BEGIN/COMMIT instead of
+            # an autocommit round-trip per chunk.
+            with self.engine.begin() as connection:
+                df.to_sql(table, connection, schema=schema, if_exists=if_exists, index=False,
+                          chunksize=chunksize, method=method)
+        except SQLAlchemyError as e:
+            raise SQLAlchemyError(f"An error occurred while inserting the DataFrame: {e}")
+
+    def _enable_fast_executemany(self):
+        """Attach a listener that turns on pyodbc's fast_executemany for batched INSERTs."""
+        if getattr(self, '_fast_executemany_enabled', False):
+            return
+
+        @event.listens_for(self.engine, 'before_cursor_execute')
+        def _set_fast_executemany(conn, cursor, statement, parameters, context, executemany):
+            if executemany:
+                cursor.fast_executemany = True
+
+        self._fast_executemany_enabled = True
+
 
 class AutoConnector(Connector):
     """
@@ -90,15 +391,77 @@ class AutoConnector(Connector):
         # Load environment variables from a .env file
         load_dotenv_file(env_file)
 
-        # Read database connection parameters from environment variables
-        db_type = load_env_var('CONNECTOR_DB_TYPE')
+        # Read database connection parameters from environment variables.
+        # The type is normalized once so the driver lookup below and the
+        # downstream dialect dispatch compare against a clean value.
+        db_type = load_env_var('CONNECTOR_DB_TYPE').strip().lower()
         db_server = load_env_var('CONNECTOR_DB_SERVER')
         db_database = load_env_var('CONNECTOR_DB_DATABASE')
         db_username = load_env_var('CONNECTOR_DB_USERNAME')
         db_password = load_env_var('CONNECTOR_DB_PASSWORD')
-        db_driver = load_env_var('CONNECTOR_DB_DRIVER') if db_type.lower() == 'mssql' else None
+        db_driver = load_env_var('CONNECTOR_DB_DRIVER') if db_type == 'mssql' else None
 
         # Initialize the superclass (Connector) with the environment variables, including the driver if applicable
         super().__init__(db_type, db_server, db_database, db_username, db_password, db_driver)
 
-        
\ No newline at end of file
+        
+
+class AsyncConnector:
+    """
+    An asynchronous database connector class built on SQLAlchemy's asyncio extension.
+
+    This class mirrors Connector for asyncio applications. Queries run on an async
+    engine (asyncpg for PostgreSQL, aioodbc for MSSQL), so a single event loop can
+    multiplex many in-flight queries instead of blocking a thread per round-trip.
+
+    Attributes:
+        engine (AsyncEngine): A SQLAlchemy asyncio engine instance for database operations.
+
+    Methods:
+        execute_query(query, params=None, chunksize=10_000): Asynchronously iterate
+            over the query results as pandas DataFrames.
+    """
+
+    def __init__(self, db_type, db_server, db_database, db_username, db_password, driver=None, **engine_kwargs):
+        """
+        Initializes the AsyncConnector with an asynchronous database connection.
+
+        Parameters:
+            db_type (str): The type of the database system ('postgresql', 'mssql', etc.).
+            db_server (str): The hostname or IP address of the database server.
+            db_database (str): The name of the database.
+            db_username (str): The username for database authentication.
+            db_password (str): The password for database authentication.
+            driver (str, optional): The ODBC driver to use for MSSQL connections. Required for MSSQL.
+            **engine_kwargs: Additional keyword arguments forwarded to create_async_engine.
+        """
+        self.engine = create_async_connection(db_type, db_server, db_database, db_username, db_password, driver, **engine_kwargs)
+
+    async def execute_query(self, query, params=None, chunksize=10_000):
+        """
+        Execute a SQL query and asynchronously yield the results as pandas DataFrames.
+
+        Rows are streamed from the database through the async driver and delivered in
+        partitions of up to 'chunksize' rows, each converted to a DataFrame. Awaiting
+        between partitions yields control to the event loop, so other coroutines can
+        run while rows are in flight.
+
+        Parameters:
+            query (str): The SQL query to execute.
+            params (dict, optional): A dictionary of parameters to pass with the query. Defaults to None.
+            chunksize (int, optional): The maximum number of rows per DataFrame chunk. Defaults to 10,000.
+
+        Yields:
+            DataFrame: DataFrames containing up to 'chunksize' rows of the query results.
+
+        Raises:
+            SQLAlchemyError: If there's an issue executing the query.
+        """
+        try:
+            async with self.engine.connect() as connection:
+                result = await connection.stream(_text_clause(query), params)
+                columns = result.keys()
+                async for partition in result.partitions(chunksize):
+                    yield pd.DataFrame(partition, columns=columns)
+        except SQLAlchemyError as e:
+            raise SQLAlchemyError(f"An error occurred while executing the query: {e}")
@@ -1,9 +1,36 @@
+import functools
 import logging
 import os
-from dotenv import load_dotenv
 
 from .custom_errors import EnvironmentVariableNotFoundError
 
+logger = logging.getLogger(__name__)
+
+# Parsed .env files keyed by (absolute path, mtime), so re-loading an unchanged
+# file reapplies a cached dict instead of re-reading and re-parsing the file.
+_PARSED_ENV_FILES = {}
+
+
+def _parse_env_file(file_path: str) -> dict:
+    """Parse a .env file into a dict of variable names to values.
+
+    Handles the common 'KEY=value' form, skipping blank lines and '#' comments
+    and stripping optional surrounding quotes — a deliberately small parser that
+    avoids python-dotenv's per-line regex work.
+    """
+    variables = {}
+    with open(file_path) as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#') or '=' not in line:
+                continue
+            key, _, value = line.partition('=')
+            value = value.strip()
+            if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+                value = value[1:-1]
+            variables[key.strip()] = value
+    return variables
+
 
 def load_dotenv_file(file_path: str) -> bool:
     """
@@ -15,6 +42,12 @@ def load_dotenv_file(file_path: str) -> bool:
     designed to be used at the start of an application to initialize
     configuration settings from an environment file.
 
+    Parsed files are cached by absolute path and modification time, so calling
+    this repeatedly with an unchanged file (e.g. constructing many AutoConnector
+    instances) reapplies the cached dict instead of re-reading the file. Editing
+    the file changes its mtime and causes it to be re-parsed. Existing
+    environment variables are not overridden.
+
     Parameters:
     - file_path (str): The path to the .env file containing environment variables.
 
@@ -29,17 +62,27 @@ def load_dotenv_file(file_path: str) -> bool:
     - Calls logging.info, which can write to stdout or a log file depending on the logging configuration.
     - Modifies the environment variables of the running process according to the contents of the .env file.
     """
-    logging.info("Loading environment variable file")
+    logger.info("Loading environment variable file")
 
-    if not os.path.exists(file_path):
-        logging.info("Loading environment variable file failed!")
+    if not os.path.isfile(file_path):
+        logger.info("Loading environment variable file failed!")
         raise FileNotFoundError(f"The specified .env file does not exist: {file_path}")
 
-    load_dotenv(dotenv_path=file_path)
-    logging.info("Loading environment variable file success!")
+    key = (os.path.abspath(file_path), os.stat(file_path).st_mtime)
+    variables = _PARSED_ENV_FILES.get(key)
+    if variables is None:
+        variables = _parse_env_file(file_path)
+        _PARSED_ENV_FILES[key] = variables
+    else:
+        logger.info("Environment variable file already parsed, reapplying cached values")
+
+    for name, value in variables.items():
+        os.environ.setdefault(name, value)
+    logger.info("Loading environment variable file success!")
     return True
 
 
+@functools.lru_cache(maxsize=None)
 def load_env_var(variable: str) -> str:
     """
     Retrieve an environment variable by its name.
@@ -48,6 +91,11 @@ def load_env_var(variable: str) -> str:
     'variable'. If the environment variable is not found, raises a
     EnvironmentVariableNotFoundError.
 
+    Results are memoized, so repeated lookups of the same variable (e.g. when
+    constructing many AutoConnector instances) cost a single dictionary hit
+    instead of an os.getenv call plus logging. Call 'load_env_var.cache_clear()'
+    if the environment has changed and values need to be re-read.
+
     Parameters:
     - variable (str): The name of the environment variable to retrieve.
 
@@ -57,10 +105,11 @@ def load_env_var(variable: str) -> str:
     Raises:
     - EnvironmentVariableNotFoundError: If the specified environment variable is not found.
     """
-    logging.info("Loading environment variable")
     env_var = os.getenv(variable)
     if env_var is None:
-        logging.info(f"Environment variable '{variable}' not found")
+        logger.info("Environment variable '%s' not found", variable)
         raise EnvironmentVariableNotFoundError(f"Environment variable '{variable}' not found")
-    logging.info(f"Environment variable '{variable}' loaded")
+    # Guard so the record is neither formatted nor handled when INFO is disabled.
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Environment variable '%s' loaded", variable)
     return env_var
\ No newline at end of file
@@ -3,7 +3,8 @@ from connector import AutoConnector
 
 conn = AutoConnector(r'.env')
 
-# Do the SQL query with parameters
+# Do the SQL query with named parameters; the same query string reuses
+# SQLAlchemy's compiled-statement cache on repeated calls
 person = conn.execute_query(
     """
         SELECT
@@ -11,13 +12,11 @@ person = conn.execute_query(
         FROM
             persons
         WHERE
-            person_number = ?
+            person_number = :person_number
     """,
-    params=(
-        8,
-    )
+    params={"person_number": 8}
 )
 print(person)
 # Output
 #   person_name
-# 0 My Name
\ No newline at end of file
+# 0 My Name
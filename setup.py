@@ -13,7 +13,6 @@ setup(
     install_requires=[
         'pandas>=2.2.0',
         'sqlalchemy>=2.0.25',
-        'python-dotenv>=1.0.1',
         'pyodbc>=5.0.1'
     ],
     classifiers=[